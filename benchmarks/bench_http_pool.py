@@ -0,0 +1,50 @@
+"""Compare bot requests sent through the pooled keep-alive transport against one connection per request.
+
+Run with ``python -m benchmarks.bench_http_pool`` from the repository root.
+"""
+
+import time
+
+from flask import Flask
+
+from flask_discord import DiscordOAuth2Session, configs
+
+from .stub_server import StubServer
+
+
+REQUESTS_NUM = 500
+
+
+def make_app():
+    app = Flask(__name__)
+    app.config["DISCORD_CLIENT_ID"] = 490732332240863233
+    app.config["DISCORD_CLIENT_SECRET"] = "BENCH_CLIENT_SECRET"
+    app.config["DISCORD_BOT_TOKEN"] = "BENCH_BOT_TOKEN"
+    app.config["DISCORD_REDIRECT_URI"] = "http://127.0.0.1:5000/callback"
+    return app
+
+
+def run(server, discord):
+    server.reset()
+    started = time.perf_counter()
+    for _ in range(REQUESTS_NUM):
+        discord.bot_request("/users/@me")
+    elapsed = time.perf_counter() - started
+    return elapsed, server.connections
+
+
+def main():
+    with StubServer() as server:
+        configs.DISCORD_API_BASE_URL = server.url
+
+        unpooled = DiscordOAuth2Session(bot_token="BENCH_BOT_TOKEN")
+        pooled = DiscordOAuth2Session(make_app())
+
+        for name, discord in (("requests.request", unpooled), ("pooled session", pooled)):
+            elapsed, connections = run(server, discord)
+            print(f"{name:>18}: {REQUESTS_NUM} requests in {elapsed:.3f}s "
+                  f"({elapsed / REQUESTS_NUM * 1000:.3f} ms/request), {connections} TCP connections")
+
+
+if __name__ == "__main__":
+    main()
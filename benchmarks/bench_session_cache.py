@@ -0,0 +1,45 @@
+"""Compare ``authorized`` and OAuth2 ``request`` with and without the OAuth2 sessions cache.
+
+Run with ``python -m benchmarks.bench_session_cache`` from the repository root.
+"""
+
+import os
+import timeit
+
+from flask import session
+
+from flask_discord import DiscordOAuth2Session, configs
+
+from .bench_http_pool import make_app
+from .stub_server import StubServer
+
+
+AUTHORIZED_NUM = 20000
+REQUESTS_NUM = 500
+TOKEN = {"access_token": "BENCH_ACCESS_TOKEN", "token_type": "Bearer", "expires_in": 604800}
+
+
+def main():
+    os.environ["OAUTHLIB_INSECURE_TRANSPORT"] = "true"
+    with StubServer() as server:
+        configs.DISCORD_API_BASE_URL = server.url
+
+        for max_limit in (0, configs.DISCORD_OAUTH2_SESSIONS_CACHE_DEFAULT_MAX_LIMIT):
+            app = make_app()
+            app.secret_key = "BENCH_SECRET_KEY"
+            app.config["DISCORD_OAUTH2_SESSIONS_CACHE_MAX_LIMIT"] = max_limit
+            discord = DiscordOAuth2Session(app)
+
+            with app.test_request_context():
+                session["DISCORD_OAUTH2_TOKEN"] = TOKEN
+                authorized = timeit.timeit(lambda: discord.authorized, number=AUTHORIZED_NUM)
+                server.reset()
+                request = timeit.timeit(lambda: discord.request("/users/@me"), number=REQUESTS_NUM)
+
+            print(f"cache max limit {max_limit:>3}: "
+                  f"authorized {authorized / AUTHORIZED_NUM * 1e6:.2f} us/call, "
+                  f"request {request / REQUESTS_NUM * 1e3:.3f} ms/call, {server.connections} TCP connections")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""A tiny local stand-in for the Discord API used by the benchmarks."""
+
+import json
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubHandler(BaseHTTPRequestHandler):
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, *args):
+        pass
+
+    def _respond(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        with self.server.lock:
+            self.server.requests += 1
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        status, headers, body = self.server.route(self)
+        if not isinstance(body, (bytes, str)):
+            body = json.dumps(body)
+            headers.setdefault("Content-Type", "application/json")
+        if isinstance(body, str):
+            body = body.encode()
+
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _respond
+
+
+class StubServer(ThreadingHTTPServer):
+    """A threaded HTTP/1.1 server which answers every route through the ``route`` callable and counts the TCP
+    connections and requests it receives.
+
+    Parameters
+    ----------
+    route : callable, optional
+        A callable receiving the request handler and returning a tuple of ``(status, headers, body)``.
+    latency : float, optional
+        Seconds to sleep before answering each request.
+
+    """
+
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, route=None, latency=0.0):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.route = route or (lambda handler: (200, dict(), {"id": "1", "path": handler.path}))
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests = 0
+        self._thread = None
+
+    @property
+    def url(self):
+        return "http://{}:{}".format(*self.server_address)
+
+    def reset(self):
+        with self.lock:
+            self.connections = 0
+            self.requests = 0
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
+
@@ -1,17 +1,103 @@
 import cachetools
+import threading
 import requests
+import hashlib
 import typing
 import json
+import time
 import abc
 
 from . import configs
+from . import backends
 from . import exceptions
 
 from flask import session, request
 from collections.abc import Mapping
+from requests.adapters import HTTPAdapter
 from requests_oauthlib import OAuth2Session
 
 
+class RateLimiter(object):
+    """A proactive rate limiter which tracks Discord rate limit buckets from the ``X-RateLimit-*`` response headers
+    and waits locally before sending a request which would otherwise be responded with HTTP 429.
+
+    Routes are mapped to buckets by their method, their path with IDs stripped and the major parameters
+    (channel, guild or webhook ID) as described in `Discord Rate Limits
+    <https://discord.com/developers/docs/topics/rate-limits>`_. Buckets are also separated by the identity
+    (the bot or the OAuth2 token) making the requests.
+
+    Parameters
+    ----------
+    backend : flask_discord.backends.RateLimitBackend, optional
+        The storage of the buckets state. Defaults to :py:class:`flask_discord.backends.MemoryRateLimitBackend`.
+    max_wait : float, optional
+        The max number of seconds to wait for a bucket. Requests needing to wait longer are sent anyway and
+        raise :py:class:`flask_discord.RateLimited` as usual.
+
+    """
+
+    MAJOR_PARAMETERS = ("channels", "guilds", "webhooks")
+
+    def __init__(self, backend=None, max_wait=configs.DISCORD_RATELIMIT_DEFAULT_MAX_WAIT):
+        self.backend = backend or backends.MemoryRateLimitBackend()
+        self.max_wait = max_wait
+
+    @classmethod
+    def get_route_key(cls, method: str, route: str) -> typing.Tuple[str, str]:
+        """Returns a tuple of route key which is the method and route with all of the IDs stripped and the major
+        parameters of the route.
+
+        """
+        parts = route.split("?", 1)[0].strip("/").split("/")
+        major_parameters = list()
+        for index, part in enumerate(parts):
+            if index and parts[index - 1] in cls.MAJOR_PARAMETERS and not major_parameters:
+                major_parameters.append(part)
+                if parts[index - 1] == "webhooks" and index + 1 < len(parts):
+                    major_parameters.append(parts[index + 1])
+            if part.isdigit() or part in major_parameters:
+                parts[index] = "{id}"
+        return f"{method.upper()} /{'/'.join(parts)}", "/".join(major_parameters)
+
+    def get_bucket(self, method: str, route: str, identity: str) -> str:
+        route_key, major_parameters = self.get_route_key(method, route)
+        bucket_hash = self.backend.get_bucket_hash(route_key) or route_key
+        return f"{identity}:{bucket_hash}:{major_parameters}"
+
+    def acquire(self, method: str, route: str, identity: str):
+        """Blocks until the request can be sent without exhausting its bucket or the global rate limit."""
+        bucket = self.get_bucket(method, route, identity)
+        while True:
+            wait = self.backend.acquire(bucket, identity, time.time())
+            if wait <= 0 or wait > self.max_wait:
+                return
+            time.sleep(wait)
+
+    def update(self, method: str, route: str, identity: str, response):
+        """Updates the buckets from the rate limit headers of the response."""
+        headers = response.headers
+        now = time.time()
+
+        if response.status_code == 429 and headers.get("X-RateLimit-Global"):
+            self.backend.lock_global(identity, now + float(headers.get("Retry-After", 1)))
+            return
+
+        route_key, _ = self.get_route_key(method, route)
+        bucket_hash = headers.get("X-RateLimit-Bucket")
+        if bucket_hash is not None:
+            self.backend.set_bucket_hash(route_key, bucket_hash)
+        try:
+            limit = int(headers["X-RateLimit-Limit"])
+            remaining = int(headers["X-RateLimit-Remaining"])
+            reset_after = float(headers["X-RateLimit-Reset-After"])
+        except (KeyError, ValueError):
+            return
+        if response.status_code == 429:
+            remaining, reset_after = 0, max(reset_after, float(headers.get("Retry-After", 0)))
+        bucket = self.get_bucket(method, route, identity)
+        self.backend.update(bucket, limit, remaining, now + reset_after, reset_after)
+
+
 class DiscordOAuth2HttpClient(abc.ABC):
     """An OAuth2 http abstract base class providing some factory methods.
     This class is meant to be overridden by :py:class:`flask_discord.DiscordOAuth2Session` and should not be
@@ -28,7 +114,7 @@ class DiscordOAuth2HttpClient(abc.ABC):
     def __init__(
             self, app=None,
             client_id=None, client_secret=None, redirect_uri=None,
-            bot_token=None, users_cache=None, proxy=None, proxy_auth=None
+            bot_token=None, users_cache=None, proxy=None, proxy_auth=None, rate_limiter=None
     ):
         self.client_id = client_id
         self.__client_secret = client_secret
@@ -37,6 +123,11 @@ class DiscordOAuth2HttpClient(abc.ABC):
         self.users_cache = users_cache
         self.proxy = proxy
         self.proxy_auth = proxy_auth
+        self.rate_limiter = rate_limiter
+        self._http_adapter = None
+        self._http_session = None
+        self._oauth2_sessions = None
+        self._oauth2_sessions_lock = threading.Lock()
 
         if app is not None:
             self.init_app(app)
@@ -62,8 +153,66 @@ class DiscordOAuth2HttpClient(abc.ABC):
             raise ValueError("Instance users_cache must be a mapping like object.")
         self.proxy = self.proxy or app.config.get("DISCORD_PROXY_SETTINGS")
         self.proxy_auth = self.proxy_auth or app.config.get("DISCORD_PROXY_AUTH_SETTINGS")
+        self._http_adapter = self._make_http_adapter(app.config)
+        self._http_session = self._make_http_session(app.config)
+        oauth2_sessions_max_limit = app.config.get(
+            "DISCORD_OAUTH2_SESSIONS_CACHE_MAX_LIMIT", configs.DISCORD_OAUTH2_SESSIONS_CACHE_DEFAULT_MAX_LIMIT)
+        self._oauth2_sessions = cachetools.LRUCache(oauth2_sessions_max_limit) if oauth2_sessions_max_limit else None
+        if self.rate_limiter is None and app.config.get(
+                "DISCORD_RATELIMIT_ENABLED", configs.DISCORD_RATELIMIT_DEFAULT_ENABLED):
+            self.rate_limiter = RateLimiter(
+                max_wait=app.config.get("DISCORD_RATELIMIT_MAX_WAIT", configs.DISCORD_RATELIMIT_DEFAULT_MAX_WAIT))
         app.discord = self
 
+    @staticmethod
+    def _make_http_adapter(config) -> HTTPAdapter:
+        """A low level method used for creating the connection pool shared by both, the OAuth2 and the bot requests.
+
+        Parameters
+        ----------
+        config : dict
+            Flask app config to read ``DISCORD_HTTP_POOL_*`` settings from.
+
+        Returns
+        -------
+        requests.adapters.HTTPAdapter
+            An instance of HTTPAdapter holding the keep-alive connection pools.
+
+        """
+        return HTTPAdapter(
+            pool_connections=config.get(
+                "DISCORD_HTTP_POOL_CONNECTIONS", configs.DISCORD_HTTP_POOL_DEFAULT_CONNECTIONS),
+            pool_maxsize=config.get("DISCORD_HTTP_POOL_MAXSIZE", configs.DISCORD_HTTP_POOL_DEFAULT_MAXSIZE),
+            max_retries=config.get("DISCORD_HTTP_POOL_MAX_RETRIES", configs.DISCORD_HTTP_POOL_DEFAULT_MAX_RETRIES),
+            pool_block=config.get("DISCORD_HTTP_POOL_BLOCK", configs.DISCORD_HTTP_POOL_DEFAULT_BLOCK),
+        )
+
+    def _make_http_session(self, config) -> requests.Session:
+        """A low level method used for creating the session used for standard (non OAuth2) requests.
+
+        Parameters
+        ----------
+        config : dict
+            Flask app config to read ``DISCORD_HTTP_POOL_*`` settings from.
+
+        Returns
+        -------
+        requests.Session
+            An instance of requests.Session mounted with the shared connection pool.
+
+        """
+        http_session = requests.Session()
+        self._mount_http_adapter(http_session)
+        if not config.get("DISCORD_HTTP_POOL_KEEP_ALIVE", configs.DISCORD_HTTP_POOL_DEFAULT_KEEP_ALIVE):
+            http_session.headers["Connection"] = "close"
+        return http_session
+
+    def _mount_http_adapter(self, http_session: requests.Session):
+        if self._http_adapter is None:
+            return
+        for prefix in ("https://", "http://"):
+            http_session.mount(prefix, self._http_adapter)
+
     @property
     def user_id(self) -> typing.Union[int, None]:
         """A property which returns Discord user ID if it exists in flask :py:attr:`flask.session` object.
@@ -97,7 +246,8 @@ class DiscordOAuth2HttpClient(abc.ABC):
         )
 
     def _make_session(self, token: str = None, state: str = None, scope: list = None) -> OAuth2Session:
-        """A low level method used for creating OAuth2 session.
+        """A low level method used for creating OAuth2 session. Sessions created only from an authorization token
+        are cached against its access token and reused until the token is refreshed or evicted from the cache.
 
         Parameters
         ----------
@@ -115,9 +265,43 @@ class DiscordOAuth2HttpClient(abc.ABC):
             An instance of OAuth2Session class.
 
         """
-        return OAuth2Session(
+        token = token or self.get_authorization_token()
+        try:
+            cache_key = token["access_token"] if state is None and scope is None else None
+        except (KeyError, TypeError):
+            cache_key = None
+        if cache_key is None or self._oauth2_sessions is None:
+            return self.__new_session(token, state, scope, self.save_authorization_token)
+
+        with self._oauth2_sessions_lock:
+            try:
+                return self._oauth2_sessions[cache_key]
+            except KeyError:
+                pass
+
+            discord = self.__new_session(token, state, scope, None)
+            discord.token_updater = self.__make_cached_token_updater(discord, cache_key)
+            self._oauth2_sessions[cache_key] = discord
+            return discord
+
+    def __make_cached_token_updater(self, discord, cache_key):
+        cache_keys = [cache_key]
+
+        def token_updater(token):
+            # Re-key the cached session so the next lookup with refreshed token still finds it.
+            with self._oauth2_sessions_lock:
+                if self._oauth2_sessions.get(cache_keys[0]) is discord:
+                    del self._oauth2_sessions[cache_keys[0]]
+                cache_keys[0] = token["access_token"]
+                self._oauth2_sessions[cache_keys[0]] = discord
+            self.save_authorization_token(token)
+
+        return token_updater
+
+    def __new_session(self, token, state, scope, token_updater) -> OAuth2Session:
+        discord = OAuth2Session(
             client_id=self.client_id,
-            token=token or self.get_authorization_token(),
+            token=token,
             state=state,
             scope=scope,
             redirect_uri=self.redirect_uri,
@@ -126,7 +310,11 @@ class DiscordOAuth2HttpClient(abc.ABC):
                 'client_secret': self.__client_secret,
             },
             auto_refresh_url=configs.DISCORD_TOKEN_URL,
-            token_updater=self.save_authorization_token)
+            token_updater=token_updater)
+        self._mount_http_adapter(discord)
+        if self._http_session is not None:
+            discord.headers.update(self._http_session.headers)
+        return discord
 
     def request(self, route: str, method="GET", data=None, oauth=True, **kwargs) -> typing.Union[dict, str]:
         """Sends HTTP request to provided route or discord endpoint.
@@ -160,15 +348,28 @@ class DiscordOAuth2HttpClient(abc.ABC):
             Raises an instance of :py:class:`flask_discord.RateLimited` if application is being rate limited by Discord.
 
         """
-        route = configs.DISCORD_API_BASE_URL + route
+        url = configs.DISCORD_API_BASE_URL + route
 
         if self.proxy is not None:
             kwargs["proxy"] = self.proxy
         if self.proxy_auth is not None:
             kwargs["proxy_auth"] = self.proxy_auth
 
-        response = self._make_session(
-        ).request(method, route, data, **kwargs) if oauth else requests.request(method, route, data=data, **kwargs)
+        if oauth:
+            discord = self._make_session()
+            identity = self._get_rate_limit_identity(discord.token)
+        else:
+            discord = self._http_session or requests
+            identity = "bot"
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(method, route, identity)
+        if oauth:
+            response = discord.request(method, url, data, **kwargs)
+        else:
+            response = discord.request(method, url, data=data, **kwargs)
+        if self.rate_limiter is not None:
+            self.rate_limiter.update(method, route, identity, response)
 
         if response.status_code == 401:
             raise exceptions.Unauthorized()
@@ -180,6 +381,13 @@ class DiscordOAuth2HttpClient(abc.ABC):
         except json.JSONDecodeError:
             return response.text
 
+    @staticmethod
+    def _get_rate_limit_identity(token) -> str:
+        try:
+            return hashlib.sha1(token["access_token"].encode()).hexdigest()
+        except (KeyError, TypeError, AttributeError):
+            return "anonymous"
+
     def bot_request(self, route: str, method="GET", **kwargs) -> typing.Union[dict, str]:
         """Make HTTP request to specified endpoint with bot token as authorization headers.
 
@@ -0,0 +1,7 @@
+from .ratelimit import RateLimitBackend, MemoryRateLimitBackend
+
+
+__all__ = [
+    "RateLimitBackend",
+    "MemoryRateLimitBackend",
+]
@@ -0,0 +1,90 @@
+import threading
+import abc
+
+
+class RateLimitBackend(abc.ABC):
+    """An abstract base class for storages holding the rate limit state of Discord buckets. Implementations must
+    make :py:meth:`acquire` atomic so that concurrent requests never reserve the same remaining slot twice.
+
+    A bucket is represented by its ``limit``, ``remaining`` requests and the UNIX timestamp ``reset_at`` when the
+    remaining requests are replenished back to limit after ``reset_after`` seconds.
+
+    """
+
+    @abc.abstractmethod
+    def get_bucket_hash(self, route_key: str):
+        """Returns the Discord bucket hash previously seen for the route key or None."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def set_bucket_hash(self, route_key: str, bucket_hash: str):
+        """Remembers the Discord bucket hash received in ``X-RateLimit-Bucket`` header for the route key."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def acquire(self, bucket: str, global_key: str, now: float) -> float:
+        """Reserves a request from the bucket if possible.
+
+        Returns
+        -------
+        float
+            ``0`` if a request was reserved otherwise the number of seconds to wait before trying again.
+
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def update(self, bucket: str, limit: int, remaining: int, reset_at: float, reset_after: float):
+        """Updates the bucket state from the rate limit headers of a response."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def lock_global(self, global_key: str, until: float):
+        """Blocks all of the requests made with the global key until the provided UNIX timestamp."""
+        raise NotImplementedError
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """A thread safe rate limit backend which keeps the state in memory of the current process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._bucket_hashes = dict()
+        self._buckets = dict()
+        self._globals = dict()
+
+    def get_bucket_hash(self, route_key):
+        return self._bucket_hashes.get(route_key)
+
+    def set_bucket_hash(self, route_key, bucket_hash):
+        self._bucket_hashes[route_key] = bucket_hash
+
+    def acquire(self, bucket, global_key, now):
+        with self._lock:
+            locked_until = self._globals.get(global_key, 0)
+            if locked_until > now:
+                return locked_until - now
+
+            state = self._buckets.get(bucket)
+            if state is None:
+                return 0
+            limit, remaining, reset_at, reset_after = state
+            if reset_at <= now:
+                remaining, reset_at = limit, now + reset_after
+            if remaining <= 0:
+                return reset_at - now
+            self._buckets[bucket] = (limit, remaining - 1, reset_at, reset_after)
+            return 0
+
+    def update(self, bucket, limit, remaining, reset_at, reset_after):
+        with self._lock:
+            state = self._buckets.get(bucket)
+            # Responses of requests which were already in flight may report more remaining requests for the same
+            # window than what has been reserved locally since then.
+            if state is not None and abs(state[2] - reset_at) < 1:
+                remaining = min(remaining, state[1])
+            self._buckets[bucket] = (limit, remaining, reset_at, reset_after)
+
+    def lock_global(self, global_key, until):
+        with self._lock:
+            self._globals[global_key] = max(until, self._globals.get(global_key, 0))
@@ -28,3 +28,14 @@ DISCORD_DEFAULT_USER_AVATAR_BASE_URL = DISCORD_EMBED_BASE_BASE_URL + "embed/avat
 DISCORD_GUILD_ICON_BASE_URL = DISCORD_IMAGE_BASE_URL + "icons/{guild_id}/{icon_hash}.png"
 
 DISCORD_USERS_CACHE_DEFAULT_MAX_LIMIT = 100
+
+DISCORD_HTTP_POOL_DEFAULT_CONNECTIONS = 10
+DISCORD_HTTP_POOL_DEFAULT_MAXSIZE = 10
+DISCORD_HTTP_POOL_DEFAULT_MAX_RETRIES = 0
+DISCORD_HTTP_POOL_DEFAULT_BLOCK = False
+DISCORD_HTTP_POOL_DEFAULT_KEEP_ALIVE = True
+
+DISCORD_OAUTH2_SESSIONS_CACHE_DEFAULT_MAX_LIMIT = 100
+
+DISCORD_RATELIMIT_DEFAULT_ENABLED = True
+DISCORD_RATELIMIT_DEFAULT_MAX_WAIT = 5.0
@@ -98,3 +98,84 @@ def test_bot_request(client_no_params, mocker):
     assert res_json['message'] == test_json['message']
     assert res_json['global'] == test_json["global"]
     assert res_json['retry_after'] == test_json["retry_after"]
+
+
+def test_init_app_http_pool(client_no_params, app):
+    app.config["DISCORD_HTTP_POOL_MAXSIZE"] = 32
+    app.config["DISCORD_HTTP_POOL_BLOCK"] = True
+    client_no_params.init_app(app)
+
+    adapter = client_no_params._http_session.get_adapter("https://discord.com/api")
+    assert adapter is client_no_params._http_adapter
+    assert adapter._pool_maxsize == 32
+    assert adapter._pool_block is True
+
+
+def test_init_app_http_pool_no_keep_alive(client_no_params, app):
+    app.config["DISCORD_HTTP_POOL_KEEP_ALIVE"] = False
+    client_no_params.init_app(app)
+
+    assert client_no_params._http_session.headers["Connection"] == "close"
+    assert client_no_params._make_session(token={"access_token": "test"}).headers["Connection"] == "close"
+
+
+def test__make_session_http_pool(client_no_params, app):
+    client_no_params.init_app(app)
+    discord = client_no_params._make_session(token={"access_token": "test"})
+    assert discord.get_adapter("https://discord.com/api") is client_no_params._http_adapter
+
+
+def test_bot_request_http_pool(client_no_params, app, mocker):
+    test_json = {'message': 'test_message'}
+    args_sn = {'status_code': 200, 'json': lambda: test_json, 'headers': {}}
+
+    client_no_params.init_app(app)
+    mocker.patch.object(requests, 'request', side_effect=AssertionError)
+    pooled_request = mocker.patch.object(
+        client_no_params._http_session, 'request', return_value=SimpleNamespace(**args_sn))
+
+    assert client_no_params.bot_request(route='test_route') == test_json
+    assert pooled_request.call_args.kwargs["headers"] == {"Authorization": "Bot TEST_BOT_TOKEN"}
+
+
+def test__make_session_cached(client_no_params, app):
+    client_no_params.init_app(app)
+    token = {"access_token": "test_access_token", "token_type": "Bearer"}
+
+    discord = client_no_params._make_session(token=token)
+    assert client_no_params._make_session(token=dict(token)) is discord
+    assert client_no_params._make_session(token={"access_token": "other_access_token"}) is not discord
+    assert client_no_params._make_session(token=token, state="test_state") is not discord
+
+
+def test__make_session_cache_disabled(client_no_params, app):
+    app.config["DISCORD_OAUTH2_SESSIONS_CACHE_MAX_LIMIT"] = 0
+    client_no_params.init_app(app)
+    token = {"access_token": "test_access_token"}
+
+    assert client_no_params._make_session(token=token) is not client_no_params._make_session(token=token)
+
+
+def test__make_session_cache_eviction(client_no_params, app):
+    app.config["DISCORD_OAUTH2_SESSIONS_CACHE_MAX_LIMIT"] = 2
+    client_no_params.init_app(app)
+
+    first = client_no_params._make_session(token={"access_token": "first"})
+    client_no_params._make_session(token={"access_token": "second"})
+    client_no_params._make_session(token={"access_token": "third"})
+
+    assert len(client_no_params._oauth2_sessions) == 2
+    assert client_no_params._make_session(token={"access_token": "first"}) is not first
+
+
+def test__make_session_cached_token_updater(client_no_params, app, mocker):
+    client_no_params.init_app(app)
+    save_authorization_token = mocker.patch.object(client_no_params, "save_authorization_token")
+
+    discord = client_no_params._make_session(token={"access_token": "expired_access_token"})
+    refreshed_token = {"access_token": "refreshed_access_token"}
+    discord.token_updater(refreshed_token)
+
+    save_authorization_token.assert_called_once_with(refreshed_token)
+    assert "expired_access_token" not in client_no_params._oauth2_sessions
+    assert client_no_params._make_session(token=refreshed_token) is discord
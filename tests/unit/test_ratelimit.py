@@ -0,0 +1,95 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from flask_discord._http import RateLimiter
+from flask_discord.backends import MemoryRateLimitBackend
+
+
+@pytest.fixture
+def rate_limiter():
+    return RateLimiter(MemoryRateLimitBackend(), max_wait=5)
+
+
+def make_response(status_code=200, **headers):
+    return SimpleNamespace(status_code=status_code, headers=requests.structures.CaseInsensitiveDict(headers))
+
+
+@pytest.mark.parametrize("route, route_key, major_parameters", [
+    ("/users/@me", "GET /users/@me", ""),
+    ("/users/@me/guilds?limit=200", "GET /users/@me/guilds", ""),
+    ("/guilds/123/members/456", "GET /guilds/{id}/members/{id}", "123"),
+    ("/channels/123/messages/456", "GET /channels/{id}/messages/{id}", "123"),
+    ("/webhooks/123/test_token/messages/456", "GET /webhooks/{id}/{id}/messages/{id}", "123/test_token"),
+])
+def test_get_route_key(route, route_key, major_parameters):
+    assert RateLimiter.get_route_key("get", route) == (route_key, major_parameters)
+
+
+def test_get_bucket_major_parameters(rate_limiter):
+    assert rate_limiter.get_bucket("PUT", "/guilds/1/members/2", "bot") != \
+        rate_limiter.get_bucket("PUT", "/guilds/3/members/2", "bot")
+    assert rate_limiter.get_bucket("PUT", "/guilds/1/members/2", "bot") == \
+        rate_limiter.get_bucket("PUT", "/guilds/1/members/3", "bot")
+
+
+def test_get_bucket_hash(rate_limiter):
+    rate_limiter.update("PUT", "/guilds/1/members/2", "bot", make_response(**{
+        "X-RateLimit-Bucket": "test_bucket", "X-RateLimit-Limit": "10",
+        "X-RateLimit-Remaining": "9", "X-RateLimit-Reset-After": "1"}))
+    assert rate_limiter.get_bucket("PUT", "/guilds/1/members/2", "bot") == "bot:test_bucket:1"
+
+
+def test_acquire_waits_for_exhausted_bucket(rate_limiter, mocker):
+    sleep = mocker.patch.object(time, "sleep", side_effect=lambda _: rate_limiter.backend.update(
+        rate_limiter.get_bucket("PUT", "/guilds/1/members/2", "bot"), 2, 2, time.time() + 1, 1))
+    rate_limiter.update("PUT", "/guilds/1/members/2", "bot", make_response(**{
+        "X-RateLimit-Limit": "2", "X-RateLimit-Remaining": "1", "X-RateLimit-Reset-After": "1"}))
+
+    rate_limiter.acquire("PUT", "/guilds/1/members/2", "bot")
+    sleep.assert_not_called()
+    rate_limiter.acquire("PUT", "/guilds/1/members/3", "bot")
+    sleep.assert_called_once()
+    assert 0 < sleep.call_args.args[0] <= 1
+
+
+def test_acquire_does_not_wait_beyond_max_wait(rate_limiter, mocker):
+    sleep = mocker.patch.object(time, "sleep")
+    rate_limiter.update("GET", "/users/@me", "bot", make_response(**{
+        "X-RateLimit-Limit": "1", "X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": "60"}))
+
+    rate_limiter.acquire("GET", "/users/@me", "bot")
+    sleep.assert_not_called()
+
+
+def test_acquire_global_rate_limit(rate_limiter, mocker):
+    sleep = mocker.patch.object(time, "sleep", side_effect=lambda _: rate_limiter.backend._globals.clear())
+    rate_limiter.update("GET", "/users/@me", "bot", make_response(429, **{
+        "X-RateLimit-Global": "true", "Retry-After": "1"}))
+
+    rate_limiter.acquire("GET", "/guilds/1", "other_identity")
+    sleep.assert_not_called()
+    rate_limiter.acquire("GET", "/guilds/1", "bot")
+    sleep.assert_called_once()
+
+
+def test_update_in_flight_responses(rate_limiter):
+    bucket = rate_limiter.get_bucket("GET", "/users/@me", "bot")
+    headers = {"X-RateLimit-Limit": "5", "X-RateLimit-Remaining": "4", "X-RateLimit-Reset-After": "1"}
+    rate_limiter.update("GET", "/users/@me", "bot", make_response(**headers))
+    for _ in range(3):
+        assert rate_limiter.backend.acquire(bucket, "bot", time.time()) == 0
+
+    rate_limiter.update("GET", "/users/@me", "bot", make_response(**headers))
+    assert rate_limiter.backend._buckets[bucket][1] == 1
+
+
+def test_memory_backend_reset(rate_limiter):
+    backend = MemoryRateLimitBackend()
+    backend.update("test_bucket", 2, 0, 10, 5)
+    assert backend.acquire("test_bucket", "bot", 9) == 1
+    assert backend.acquire("test_bucket", "bot", 10) == 0
+    assert backend.acquire("test_bucket", "bot", 11) == 0
+    assert backend.acquire("test_bucket", "bot", 12) == 3